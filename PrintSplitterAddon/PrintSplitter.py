@@ -2,11 +2,10 @@
 
 import FreeCAD
 import FreeCADGui
-import Part # Needed for checking object type
 from PySide import QtGui, QtCore # Needed for messages and translation
 
-# Import the task panel class using direct import
-from PrintSplitterTaskPanel import PrintSplitterTaskPanel
+# NOTE: Part and PrintSplitterTaskPanel are imported lazily inside the command
+# so that loading the workbench does not pay for the geometry modules.
 
 class PrintSplitterCommand:
     """
@@ -27,36 +26,57 @@ class PrintSplitterCommand:
         """ Executed when the command is clicked """
         FreeCAD.Console.PrintMessage("PrintSplitter Command Activated\n")
 
+        # Heavy imports deferred until the command is actually used
+        from PrintSplitterTaskPanel import PrintSplitterTaskPanel
+
         # 1. Check Selection
         selection = FreeCADGui.Selection.getSelection()
         if not selection:
-            msg = "Please select exactly one solid object to split."
+            msg = "Please select at least one solid object to split."
             FreeCAD.Console.PrintError(msg + "\n")
             QtGui.QMessageBox.warning(None, "Selection Error", msg)
             return
 
-        if len(selection) > 1:
-            msg = "Please select only one solid object."
-            FreeCAD.Console.PrintError(msg + "\n")
-            QtGui.QMessageBox.warning(None, "Selection Error", msg)
+        # 2./3. Validate every selected object, keeping only the usable ones
+        valid_objs = []
+        rejected = []
+        for selected_obj in selection:
+            error_msg = self.validate_object(selected_obj)
+            if error_msg:
+                FreeCAD.Console.PrintError(error_msg + "\n")
+                rejected.append(error_msg)
+            else:
+                valid_objs.append(selected_obj)
+
+        if not valid_objs:
+            QtGui.QMessageBox.warning(None, "Selection Error", "\n".join(rejected))
             return
+        if rejected:
+            FreeCAD.Console.PrintWarning(f"Skipping {len(rejected)} invalid object(s); splitting {len(valid_objs)}.\n")
 
-        selected_obj = selection[0]
+        # 4. Create and show the task panel, passing the selected objects (one job each)
+        try:
+            # Keep track of the panel instance if needed, otherwise just show
+            panel = PrintSplitterTaskPanel(valid_objs)
+            panel.show() # Use the show method defined in the panel class
+            # FreeCADGui.Control.showDialog(panel) # Older method, createDialog is preferred
+        except Exception as e:
+            FreeCAD.Console.PrintError(f"Failed to create or show the Task Panel: {e}\n")
+            import traceback
+            traceback.print_exc()
+            QtGui.QMessageBox.critical(None, "Error", "Could not open the PrintSplitter panel.")
 
-        # 2. Check Object Type (must be a Part::Feature or similar with a valid Shape)
+    def validate_object(self, selected_obj):
+        """ Returns an error message if the object cannot be split, otherwise None """
+        import Part # Needed for checking object type (imported lazily)
+        # Check Object Type (must be a Part::Feature or similar with a valid Shape)
         if not hasattr(selected_obj, "Shape") or not isinstance(selected_obj.Shape, Part.Shape):
-             msg = f"Selected object '{selected_obj.Label}' is not a valid Part object."
-             FreeCAD.Console.PrintError(msg + "\n")
-             QtGui.QMessageBox.warning(None,"Selection Error", msg)
-             return
+             return f"Selected object '{selected_obj.Label}' is not a valid Part object."
 
-        # 3. Check if the Shape is valid (not Null, has volume for solids)
+        # Check if the Shape is valid (not Null, has volume for solids)
         try:
             if selected_obj.Shape.isNull():
-                msg = f"Selected object '{selected_obj.Label}' has invalid geometry (Shape is Null)."
-                FreeCAD.Console.PrintError(msg + "\n")
-                QtGui.QMessageBox.warning(None,"Selection Error", msg)
-                return
+                return f"Selected object '{selected_obj.Label}' has invalid geometry (Shape is Null)."
             # Optional: Check if it's a solid (might allow splitting shells later?)
             if not isinstance(selected_obj.Shape, Part.Solid):
                  # For now, only support solids
@@ -69,30 +89,12 @@ class PrintSplitterCommand:
                       raise TypeError("Shape is not a Solid")
             # Check volume as a basic validity check for solids
             if selected_obj.Shape.Volume < 1e-9:
-                 msg = f"Selected object '{selected_obj.Label}' has zero or negligible volume."
-                 FreeCAD.Console.PrintWarning(msg + "\n") # Warning instead of error?
-                 # QtGui.QMessageBox.warning(None,"Selection Error", msg)
-                 # return # Allow processing zero volume solids? Maybe not.
                  # Let's treat it as an error for splitting
                  raise ValueError("Shape has zero volume")
 
         except Exception as e:
-            msg = f"Selected object '{selected_obj.Label}' has invalid or unsupported geometry type ({e})."
-            FreeCAD.Console.PrintError(msg + "\n")
-            QtGui.QMessageBox.warning(None,"Selection Error", msg)
-            return
-
-        # 4. Create and show the task panel, passing the selected object
-        try:
-            # Keep track of the panel instance if needed, otherwise just show
-            panel = PrintSplitterTaskPanel(selected_obj)
-            panel.show() # Use the show method defined in the panel class
-            # FreeCADGui.Control.showDialog(panel) # Older method, createDialog is preferred
-        except Exception as e:
-            FreeCAD.Console.PrintError(f"Failed to create or show the Task Panel: {e}\n")
-            import traceback
-            traceback.print_exc()
-            QtGui.QMessageBox.critical(None, "Error", "Could not open the PrintSplitter panel.")
+            return f"Selected object '{selected_obj.Label}' has invalid or unsupported geometry type ({e})."
+        return None
 
     def IsActive(self):
         """ Defines when the command is active (clickable) """
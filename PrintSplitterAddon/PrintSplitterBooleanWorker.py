@@ -0,0 +1,59 @@
+# PrintSplitterAddon/PrintSplitterBooleanWorker.py
+
+# Runs boolean operations. This file is used in two ways:
+#  - Imported by PrintSplitterBooleans.py, which calls apply_operation() in-process.
+#  - Executed by FreeCADCmd as a long-lived worker process. Jobs arrive as JSON
+#    lines on stdin (shapes are passed as BREP files) and each answer is written
+#    to stdout as one line starting with RESULT_PREFIX.
+# Importing this module has no side effects; the worker loop only starts from
+# the __main__ guard at the bottom.
+
+import os
+import sys
+import json
+import traceback
+import Part
+
+RESULT_PREFIX = "PRINTSPLITTER_RESULT "
+
+def apply_operation(op, shape, tool, fuzzy=0.0):
+    """ Applies op ('cut', 'fuse' or 'halfspace_split') to shape with tool and returns the result """
+    if op == "cut":
+        return shape.cut(tool, fuzzy) if fuzzy > 0 else shape.cut(tool)
+    if op == "fuse":
+        return shape.fuse(tool, fuzzy) if fuzzy > 0 else shape.fuse(tool)
+    if op == "halfspace_split":
+        # tool is a solid filling one side of the cut plane: keep both sides as separate solids
+        inside = shape.common(tool, fuzzy) if fuzzy > 0 else shape.common(tool)
+        outside = shape.cut(tool, fuzzy) if fuzzy > 0 else shape.cut(tool)
+        return Part.makeCompound(inside.Solids + outside.Solids)
+    raise ValueError(f"Unknown boolean operation: {op}")
+
+def run_job(job):
+    """ Runs one job dict and writes the result BREP. Returns the answer dict for the parent. """
+    try:
+        shape = Part.read(job["shape_file"])
+        tool = Part.read(job["tool_file"])
+        result = apply_operation(job["op"], shape, tool, job.get("fuzzy", 0.0))
+        if result is None or result.isNull():
+            return {"id": job["id"], "ok": False, "error": "boolean returned a null shape"}
+        result.exportBrep(job["result_file"])
+        return {"id": job["id"], "ok": True}
+    except Exception as e:
+        return {"id": job.get("id"), "ok": False, "error": f"{e}\n{traceback.format_exc()}"}
+
+def serve():
+    """ Worker loop: one JSON job per stdin line until stdin is closed """
+    # Use the raw file descriptors: FreeCAD may redirect sys.stdout to its console
+    with open(0, "r", closefd=False) as job_stream:
+        for line in job_stream:
+            if not line.strip():
+                continue
+            answer = run_job(json.loads(line))
+            os.write(1, (RESULT_PREFIX + json.dumps(answer) + "\n").encode("utf-8"))
+
+if __name__ == "__main__":
+    serve()
+    sys.stdout.flush()
+    # os._exit makes sure FreeCADCmd terminates instead of entering its console
+    os._exit(0)
@@ -0,0 +1,252 @@
+# PrintSplitterAddon/PrintSplitterBooleans.py
+
+import os
+import sys
+import json
+import time
+import queue
+import shutil
+import signal
+import tempfile
+import threading
+import subprocess
+import collections
+
+import FreeCAD
+import Part
+from FreeCAD import Base
+
+from PrintSplitterBooleanWorker import apply_operation, RESULT_PREFIX
+
+# Retry ladder, tried in this order until one step gives a valid result.
+# The plane steps are only used when the caller describes the cut plane.
+STEP_PLAIN = "plain"
+STEP_FUZZY = "fuzzy"
+STEP_NUDGE = "nudge"
+STEP_HALFSPACE = "halfspace"
+RETRY_STEPS = [STEP_PLAIN, STEP_FUZZY, STEP_NUDGE, STEP_HALFSPACE]
+
+DEFAULT_TIMEOUT = 60.0 # Seconds allowed for one operation, all retry steps included
+DEFAULT_FUZZY = 1e-3 # Fuzzy tolerance (mm) for the second step
+DEFAULT_NUDGE = 0.01 # Plane offset (mm) for the third step
+
+AXES = {'x': Base.Vector(1, 0, 0), 'y': Base.Vector(0, 1, 0), 'z': Base.Vector(0, 0, 1)}
+
+class BooleanExecutor:
+    """
+    Runs boolean operations with an automatic retry ladder:
+    plain -> fuzzy tolerance -> nudged cut plane -> half-space tool.
+    The timeout is a total deadline per operation; each retry step gets an equal
+    share of the time left.
+    When isolated, attempts run in one long-lived FreeCADCmd worker process that is
+    killed (and restarted on the next job) when the deadline is hit or it crashes.
+    Otherwise attempts run in-process and cannot be interrupted.
+    Call close() when the batch is finished to stop the worker.
+    """
+    def __init__(self, timeout=DEFAULT_TIMEOUT, isolated=True, fuzzy=DEFAULT_FUZZY, nudge=DEFAULT_NUDGE):
+        self.timeout = timeout
+        self.fuzzy = fuzzy
+        self.nudge = nudge
+        self.worker_cmd = self.find_worker_executable() if isolated else None
+        self.worker_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "PrintSplitterBooleanWorker.py")
+        self.step_counts = {step: 0 for step in RETRY_STEPS} # Which retry step succeeded, per operation
+        self.failed_count = 0
+
+        # Worker process state (started lazily on the first isolated job)
+        self.proc = None
+        self.answers = None # queue.Queue of answer dicts, None on worker EOF
+        self.worker_log = collections.deque(maxlen=40) # Last non-protocol output lines
+        self.work_dir = None
+        self.job_id = 0
+
+        if isolated and not self.worker_cmd:
+            FreeCAD.Console.PrintWarning("FreeCADCmd not found. Boolean operations will run in-process without a timeout.\n")
+
+    # --- Helper Function: Locate FreeCADCmd ---
+    def find_worker_executable(self):
+        """ Returns the path of the FreeCAD console executable, or None """
+        names = ["FreeCADCmd", "freecadcmd", "FreeCADCmd.exe"]
+        search_dirs = [os.path.join(FreeCAD.getHomePath(), "bin"), os.path.dirname(sys.executable)]
+        for directory in search_dirs:
+            for name in names:
+                candidate = os.path.join(directory, name)
+                if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+                    return candidate
+        for name in names:
+            found = shutil.which(name)
+            if found: return found
+        return None
+
+    # --- Public API ---
+    def cut(self, shape, tool, plane=None):
+        """
+        Cuts tool from shape. plane=(axis, position) describes the thin cutting box
+        so the nudge and half-space steps can be used. Returns (result, step) or (None, None).
+        """
+        return self.run("cut", shape, tool, plane)
+
+    def fuse(self, shape, tool):
+        """ Fuses tool into shape. Returns (result, step) or (None, None). """
+        return self.run("fuse", shape, tool, None)
+
+    def summary(self):
+        """ Returns a one-line report of which retry steps were needed """
+        counts = ", ".join(f"{step}={count}" for step, count in self.step_counts.items())
+        return f"Boolean operations: {counts}, failed={self.failed_count}"
+
+    # --- Retry Ladder ---
+    def run(self, op, shape, tool, plane):
+        # Plane-specific steps need to know the cut plane
+        steps = [step for step in RETRY_STEPS if plane is not None or step not in (STEP_NUDGE, STEP_HALFSPACE)]
+        deadline = time.monotonic() + self.timeout
+        for step_index, step in enumerate(steps):
+            # Each step gets an equal share of the time left, so a step that times
+            # out still leaves time for the remaining retries
+            remaining = deadline - time.monotonic()
+            if self.worker_cmd and remaining <= 0:
+                FreeCAD.Console.PrintWarning(f"    Boolean {op}: {self.timeout:.0f} s deadline reached before step '{step}'.\n")
+                break
+            step_timeout = remaining / (len(steps) - step_index)
+
+            step_op, step_tool, fuzzy = op, tool, 0.0
+            if step == STEP_FUZZY:
+                fuzzy = self.fuzzy
+            elif step == STEP_NUDGE:
+                axis = plane[0]
+                step_tool = tool.copy()
+                step_tool.translate(AXES[axis] * self.nudge)
+            elif step == STEP_HALFSPACE:
+                step_op = "halfspace_split"
+                step_tool = self.make_halfspace_tool(shape, plane)
+
+            try:
+                result = self.execute(step_op, shape, step_tool, fuzzy, step_timeout)
+            except Exception as e:
+                FreeCAD.Console.PrintWarning(f"    Boolean {op} ({step}) failed: {e}\n")
+                continue
+
+            if self.is_valid_result(result):
+                if step != STEP_PLAIN:
+                    FreeCAD.Console.PrintMessage(f"    Boolean {op} succeeded on retry step '{step}'.\n")
+                self.step_counts[step] += 1
+                return result, step
+            FreeCAD.Console.PrintWarning(f"    Boolean {op} ({step}) gave an invalid result.\n")
+
+        self.failed_count += 1
+        return None, None
+
+    def is_valid_result(self, result):
+        if result is None or result.isNull() or not result.isValid():
+            return False
+        return any(s.Volume > 1e-9 for s in result.Solids)
+
+    def make_halfspace_tool(self, shape, plane):
+        """ Builds a box that fills the positive side of the plane over the whole shape """
+        axis, position = plane
+        bbox = shape.BoundBox
+        size = bbox.DiagonalLength * 2 + 1.0
+        center = bbox.Center
+        origin = Base.Vector(center.x - size / 2, center.y - size / 2, center.z - size / 2)
+        if axis == 'x': origin.x = position
+        elif axis == 'y': origin.y = position
+        else: origin.z = position
+        return Part.makeBox(size, size, size, origin)
+
+    # --- Execution (isolated or in-process) ---
+    def execute(self, op, shape, tool, fuzzy, timeout):
+        if not self.worker_cmd:
+            return apply_operation(op, shape, tool, fuzzy)
+
+        if self.proc is None:
+            self.start_worker()
+
+        self.job_id += 1
+        shape_file = os.path.join(self.work_dir, "shape.brep")
+        tool_file = os.path.join(self.work_dir, "tool.brep")
+        result_file = os.path.join(self.work_dir, "result.brep")
+        for path in (shape_file, tool_file, result_file):
+            if os.path.exists(path): os.remove(path)
+        shape.exportBrep(shape_file)
+        tool.exportBrep(tool_file)
+        job = {"id": self.job_id, "op": op, "fuzzy": fuzzy, "shape_file": shape_file,
+               "tool_file": tool_file, "result_file": result_file}
+
+        try:
+            self.proc.stdin.write(json.dumps(job) + "\n")
+            self.proc.stdin.flush()
+            answer = self.answers.get(timeout=timeout)
+        except queue.Empty:
+            self.stop_worker()
+            raise RuntimeError(f"timed out after {timeout:.1f} s (worker killed)")
+        except OSError as e: # Broken pipe: the worker died between jobs
+            answer = None
+            self.worker_log.append(f"write failed: {e}")
+
+        if answer is None:
+            exit_code = self.stop_worker()
+            raise RuntimeError(f"worker exited with code {exit_code}. Output:\n{self.worker_output()}")
+        if not answer.get("ok"):
+            raise RuntimeError(f"{answer.get('error')}\nWorker output:\n{self.worker_output()}")
+        return Part.read(result_file)
+
+    # --- Worker Process Management ---
+    def start_worker(self):
+        if self.work_dir is None:
+            self.work_dir = tempfile.mkdtemp(prefix="printsplitter_")
+        self.worker_log.clear()
+        popen_args = {}
+        if os.name == "nt":
+            popen_args["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            popen_args["start_new_session"] = True # Own process group, so launcher wrappers are killed too
+        self.proc = subprocess.Popen([self.worker_cmd, self.worker_script], stdin=subprocess.PIPE,
+                                     stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                                     bufsize=1, **popen_args)
+        self.answers = queue.Queue()
+        reader = threading.Thread(target=self.read_worker_output, args=(self.proc, self.answers), daemon=True)
+        reader.start()
+
+    def read_worker_output(self, proc, answers):
+        """ Reader thread: protocol lines go to the answer queue, everything else to the log """
+        for line in proc.stdout:
+            if line.startswith(RESULT_PREFIX):
+                answers.put(json.loads(line[len(RESULT_PREFIX):]))
+            else:
+                self.worker_log.append(line.rstrip())
+        answers.put(None) # EOF: worker exited
+
+    def worker_output(self):
+        return "\n".join(self.worker_log) or "(no output)"
+
+    def stop_worker(self):
+        """ Kills the worker and its whole process group. Returns its exit code. """
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return None
+        # Kill the whole group even if the direct child already exited: with a
+        # launcher wrapper (AppImage, snap, flatpak) the real worker may still run
+        try:
+            if os.name == "nt":
+                if proc.poll() is None:
+                    subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            else:
+                os.killpg(proc.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        proc.kill() # No-op if already gone
+        try: return proc.wait(timeout=5)
+        except subprocess.TimeoutExpired: return None
+
+    def close(self):
+        """ Stops the worker (if any) and removes the temporary files """
+        if self.proc is not None:
+            try:
+                self.proc.stdin.close() # Worker exits on EOF
+                self.proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+            self.stop_worker()
+        if self.work_dir:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+            self.work_dir = None
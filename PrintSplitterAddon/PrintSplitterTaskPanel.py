@@ -8,15 +8,25 @@ from PySide import QtGui, QtCore
 import Part
 import math
 from FreeCAD import Base # For Vector
-import Draft # Potentially needed for upgrade/downgrade later if booleans fail often
+from PrintSplitterBooleans import BooleanExecutor, DEFAULT_TIMEOUT
 # --- End of Imports ---
 
+# Splitting modes
+SPLIT_MODE_GRID = "Uniform grid"
+SPLIT_MODE_RECURSIVE = "Recursive (split until each piece fits)"
+MAX_RECURSION_DEPTH = 12 # Safety limit for recursive splitting
+
 class PrintSplitterTaskPanel:
     """
     Defines the Task Panel UI and the core processing logic.
+    Every selected object becomes one job in a queue that shares the same
+    printer and connector settings.
     """
-    def __init__(self, selected_obj):
-        self.obj_to_split = selected_obj
+    def __init__(self, selected_objs):
+        # Accept a single object for backwards compatibility
+        if not isinstance(selected_objs, (list, tuple)):
+            selected_objs = [selected_objs]
+        self.objs_to_split = list(selected_objs)
         self.dialog = None
 
         # --- UI Setup ---
@@ -42,6 +52,17 @@ class PrintSplitterTaskPanel:
         printer_layout.addRow("Height (Z):", self.printer_z_input)
         main_layout.addWidget(printer_group)
 
+        # Splitting Mode
+        mode_group = QtGui.QGroupBox("Splitting Mode")
+        mode_layout = QtGui.QFormLayout(mode_group)
+        self.split_mode_input = QtGui.QComboBox()
+        self.split_mode_input.addItems([SPLIT_MODE_GRID, SPLIT_MODE_RECURSIVE])
+        mode_layout.addRow("Mode:", self.split_mode_input)
+        mode_info = QtGui.QLabel("<i>Recursive mode only splits pieces that do not fit yet, giving fewer pieces on irregular models.</i>")
+        mode_info.setWordWrap(True)
+        mode_layout.addRow(mode_info)
+        main_layout.addWidget(mode_group)
+
         # Connector Options Group
         self.connector_group = QtGui.QGroupBox("Connector Options")
         self.connector_group.setCheckable(True) # Make group checkable
@@ -65,8 +86,25 @@ class PrintSplitterTaskPanel:
 
         main_layout.addWidget(self.connector_group)
 
+        # Boolean Options Group
+        boolean_group = QtGui.QGroupBox("Boolean Options")
+        boolean_layout = QtGui.QFormLayout(boolean_group)
+        self.isolated_checkbox = QtGui.QCheckBox("Run booleans in isolated process (enables the timeout)")
+        self.isolated_checkbox.setChecked(True) # Falls back to in-process if FreeCADCmd is not found
+        boolean_layout.addRow(self.isolated_checkbox)
+        self.timeout_input = QtGui.QLineEdit(f"{DEFAULT_TIMEOUT:.0f}")
+        self.timeout_input.setValidator(QtGui.QDoubleValidator(1.0, 3600.0, 1))
+        boolean_layout.addRow("Total timeout per boolean (s):", self.timeout_input)
+        self.boolean_info = QtGui.QLabel()
+        self.boolean_info.setWordWrap(True)
+        boolean_layout.addRow(self.boolean_info)
+        self.isolated_checkbox.toggled.connect(self.update_boolean_options)
+        self.update_boolean_options(self.isolated_checkbox.isChecked())
+        main_layout.addWidget(boolean_group)
+
         # Process Button
-        self.process_button = QtGui.QPushButton("Split Object")
+        button_text = "Split Object" if len(self.objs_to_split) == 1 else f"Split {len(self.objs_to_split)} Objects"
+        self.process_button = QtGui.QPushButton(button_text)
         self.process_button.clicked.connect(self.process)
         main_layout.addWidget(self.process_button)
 
@@ -80,6 +118,15 @@ class PrintSplitterTaskPanel:
         # Asegurándonos de que esta es la línea que se usa:
         FreeCADGui.Control.showDialog(self)
 
+    def update_boolean_options(self, isolated):
+        """ The timeout only applies when booleans run in the isolated worker process """
+        self.timeout_input.setEnabled(isolated)
+        retry_text = "Failed operations are retried with a fuzzy tolerance, a nudged cut plane and a half-space tool."
+        if isolated:
+            self.boolean_info.setText(f"<i>{retry_text} All retries of one boolean share the timeout, so no boolean blocks longer than this.</i>")
+        else:
+            self.boolean_info.setText(f"<i>{retry_text} Without isolation booleans run inside FreeCAD and cannot be interrupted: there is no timeout.</i>")
+
     def accept(self): return True # Dialog handled by button click
     def reject(self):
         FreeCADGui.Control.closeDialog(self.dialog)
@@ -88,8 +135,18 @@ class PrintSplitterTaskPanel:
         if self.dialog: FreeCADGui.Control.closeDialog(self.dialog)
 
     # --- Helper Function: Find Matching Faces ---
-    def find_matching_planar_faces(self, shape1, shape2, tolerance=1e-4):
-        matching_face_indices = []
+    def find_matching_planar_faces(self, shape1, shape2, tolerance=1e-4, connector_radius=None):
+        """
+        Finds interfaces between two pieces: coplanar planar faces (within tolerance)
+        with opposite normals that overlap. With connector_radius, only interfaces where
+        a disc of that radius around the overlap centre lies inside the overlap are kept;
+        narrow or non-convex overlaps that cannot hold the connector are skipped with a warning.
+        Faces are matched by overlap, not by centre of mass, so a large face on one
+        piece also matches the smaller faces of two pieces split further on the other
+        side (T-junctions in recursive mode).
+        Returns a list of (face1_idx, face2_idx, overlap_center, normal1).
+        """
+        matches = []
         if not shape1 or shape1.isNull() or not shape2 or shape2.isNull(): return []
         if not isinstance(shape1, Part.Shape) or not isinstance(shape2, Part.Shape): return []
 
@@ -100,32 +157,54 @@ class PrintSplitterTaskPanel:
 
         for i, f1 in enumerate(faces1):
             try:
-                if f1.Surface.TypeId == "Part::GeomPlane" and f1.Area > min_area:
-                    com1 = f1.CenterOfMass
-                    try: normal1 = f1.normalAt(f1.Surface.parameter(com1)[0], f1.Surface.parameter(com1)[1])
-                    except: continue
-
-                    for j, f2 in enumerate(faces2):
-                        try:
-                            if f2.Surface.TypeId == "Part::GeomPlane" and f2.Area > min_area:
-                                com2 = f2.CenterOfMass
-                                if not f1.BoundBox.intersect(f2.BoundBox).isValid(): continue
-
-                                distance = com1.distanceToPoint(com2)
-                                if distance < tolerance:
-                                    try: normal2 = f2.normalAt(f2.Surface.parameter(com2)[0], f2.Surface.parameter(com2)[1])
-                                    except: continue
-
-                                    dot_product = normal1.dot(normal2)
-                                    # Check if normals are opposite (dot product close to -1)
-                                    if abs(dot_product + 1.0) < tolerance:
-                                        # --- DEBUG --- 
-                                        # FreeCAD.Console.PrintMessage(f"      Found Potential Match: Face {i} (Area {f1.Area:.1f}) of Shape1 and Face {j} (Area {f2.Area:.1f}) of Shape2 at dist {distance:.4f}")
-                                        # ------------- 
-                                        matching_face_indices.append((i, j))
-                        except: pass # Inner loop error
+                if f1.Surface.TypeId != "Part::GeomPlane" or f1.Area <= min_area: continue
+                com1 = f1.CenterOfMass
+                try: normal1 = f1.normalAt(*f1.Surface.parameter(com1))
+                except: continue
+                search_box = f1.BoundBox
+                search_box.enlarge(tolerance) # Pieces are separated by the thin cutting box
+
+                for j, f2 in enumerate(faces2):
+                    try:
+                        if f2.Surface.TypeId != "Part::GeomPlane" or f2.Area <= min_area: continue
+                        if not search_box.intersect(f2.BoundBox): continue
+
+                        com2 = f2.CenterOfMass
+                        try: normal2 = f2.normalAt(*f2.Surface.parameter(com2))
+                        except: continue
+                        # Normals must be opposite (dot product close to -1)
+                        if abs(normal1.dot(normal2) + 1.0) >= tolerance: continue
+                        # Faces must be coplanar (gap along the normal within tolerance)
+                        gap = (com2 - com1).dot(normal1)
+                        if abs(gap) >= tolerance: continue
+
+                        # Project f2 onto f1's plane and measure the real overlap
+                        f2_projected = f2.copy()
+                        f2_projected.translate(normal1 * -gap)
+                        overlap = f1.common(f2_projected)
+                        overlap_faces = [f for f in overlap.Faces if f.Area > 0]
+                        overlap_area = sum(f.Area for f in overlap_faces)
+                        if overlap_area <= min_area: continue
+
+                        # Area-weighted centre of the overlap region
+                        center = Base.Vector(0, 0, 0)
+                        for f in overlap_faces:
+                            center = center + f.CenterOfMass * (f.Area / overlap_area)
+
+                        if connector_radius and not self.disc_fits_in_overlap(overlap, center, normal1, connector_radius):
+                            FreeCAD.Console.PrintWarning(f"      Interface between face {i} and face {j} is too narrow (or non-convex) for a {2 * connector_radius:.2f} mm connector at its centre. Skipping connector.\n")
+                            continue
+                        matches.append((i, j, center, normal1))
+                    except: pass # Inner loop error
             except: pass # Outer loop error
-        return matching_face_indices
+        return matches
+
+    # --- Helper Function: Check Connector Fits in Interface ---
+    def disc_fits_in_overlap(self, overlap, center, normal, radius):
+        """ True if a disc of radius around center (in the overlap plane) lies inside the overlap """
+        disc = Part.Face(Part.Wire(Part.makeCircle(radius, center, normal)))
+        covered_area = overlap.common(disc).Area
+        return covered_area >= disc.Area * (1 - 1e-3)
 
     # --- Helper Function: Check if BBox Fits Printer ---
     def check_fit(self, piece_bbox, printer_dims):
@@ -146,41 +225,322 @@ class PrintSplitterTaskPanel:
         return False # Does not fit in any orientation
 
 
-    # --- Main Processing Function ---
-    def process(self):
-        FreeCAD.ActiveDocument.openTransaction("Split and Add Connectors") # Start transaction
-        piece_objects = [] # Keep track of created Part::Feature objects
-        result_group = None # Group for results
-        temp_cutter_obj = None # For temporary cutter features
+    # --- Helper Function: Read Shared Settings ---
+    def read_settings(self):
+        """ Reads the printer and connector settings shared by every job """
+        printer_x = float(self.printer_x_input.text())
+        printer_y = float(self.printer_y_input.text())
+        printer_z = float(self.printer_z_input.text())
+
+        add_connectors = self.connector_group.isChecked()
+        pin_diameter = float(self.pin_diameter_input.text()) if add_connectors else 0
+        pin_height = float(self.pin_height_input.text()) if add_connectors else 0
+        tolerance = float(self.tolerance_input.text()) if add_connectors else 0
+
+        if add_connectors and (pin_diameter <= 0 or pin_height <= 0):
+             raise ValueError("Pin diameter and height must be positive if adding connectors.")
+        if add_connectors and pin_height >= min(printer_x, printer_y, printer_z):
+             raise ValueError("Pin height must be smaller than every printer dimension.")
+
+        boolean_timeout = float(self.timeout_input.text())
+        if boolean_timeout <= 0:
+             raise ValueError("Boolean timeout must be positive.")
+
+        return {
+            'printer_dims': (printer_x, printer_y, printer_z),
+            'split_mode': self.split_mode_input.currentText(),
+            'add_connectors': add_connectors,
+            'pin_diameter': pin_diameter,
+            'pin_height': pin_height,
+            'tolerance': tolerance,
+            'boolean_timeout': boolean_timeout,
+            'isolated_booleans': self.isolated_checkbox.isChecked(),
+        }
+
+    # --- Helper Function: Build Job Queue ---
+    def build_job_queue(self, objs):
+        """ Returns the objects ordered largest first (by global bounding box volume) """
+        def job_size(obj):
+            try:
+                bbox = obj.Shape.BoundBox
+                return bbox.XLength * bbox.YLength * bbox.ZLength
+            except: return 0.0
+        return sorted(objs, key=job_size, reverse=True)
+
+    # --- Splitting Mode: Global Uniform Grid ---
+    def grid_split(self, shape_to_split, global_bbox, printer_dims, booleans):
+        """ Cuts the whole shape with one global grid of planes derived from global_bbox """
+        printer_x, printer_y, printer_z = printer_dims
+        needs_split_x = global_bbox.XLength > printer_x
+        needs_split_y = global_bbox.YLength > printer_y
+        needs_split_z = global_bbox.ZLength > printer_z
+
+        # Calculate and Create Cutting TOOLS (Boxes instead of Planes)
+        cutting_tool_shapes = []
+        cutting_planes = [] # (axis, position) for each tool, used by the boolean retry ladder
+        tool_buffer = max(global_bbox.XLength, global_bbox.YLength, global_bbox.ZLength) * 2 # Even larger buffer for boxes
+        tool_thickness = 0.001 # Very small thickness for the cutting box
+
+        # X Cuts - Create Boxes
+        num_cuts_x = int(math.ceil(global_bbox.XLength / printer_x)) - 1 if needs_split_x else 0
+        if num_cuts_x > 0:
+            step_x = global_bbox.XLength / (num_cuts_x + 1)
+            for i in range(1, num_cuts_x + 1):
+                pos_x = global_bbox.XMin + i * step_x
+                # Center the box on the cut plane, make it large in Y/Z, thin in X
+                center_vec = Base.Vector(pos_x, global_bbox.Center.y, global_bbox.Center.z)
+                box = Part.makeBox(tool_thickness, tool_buffer, tool_buffer, center_vec)
+                # Adjust position so the center is on the cut plane
+                box.translate(Base.Vector(-tool_thickness / 2, -tool_buffer / 2, -tool_buffer / 2))
+                cutting_tool_shapes.append(box)
+                cutting_planes.append(('x', pos_x))
+        # Y Cuts - Create Boxes
+        num_cuts_y = int(math.ceil(global_bbox.YLength / printer_y)) - 1 if needs_split_y else 0
+        if num_cuts_y > 0:
+            step_y = global_bbox.YLength / (num_cuts_y + 1)
+            for i in range(1, num_cuts_y + 1):
+                pos_y = global_bbox.YMin + i * step_y
+                center_vec = Base.Vector(global_bbox.Center.x, pos_y, global_bbox.Center.z)
+                box = Part.makeBox(tool_buffer, tool_thickness, tool_buffer, center_vec)
+                box.translate(Base.Vector(-tool_buffer / 2, -tool_thickness / 2, -tool_buffer / 2))
+                cutting_tool_shapes.append(box)
+                cutting_planes.append(('y', pos_y))
+        # Z Cuts - Create Boxes
+        num_cuts_z = int(math.ceil(global_bbox.ZLength / printer_z)) - 1 if needs_split_z else 0
+        if num_cuts_z > 0:
+            step_z = global_bbox.ZLength / (num_cuts_z + 1)
+            for i in range(1, num_cuts_z + 1):
+                pos_z = global_bbox.ZMin + i * step_z
+                center_vec = Base.Vector(global_bbox.Center.x, global_bbox.Center.y, pos_z)
+                box = Part.makeBox(tool_buffer, tool_buffer, tool_thickness, center_vec)
+                box.translate(Base.Vector(-tool_buffer / 2, -tool_buffer / 2, -tool_thickness / 2))
+                cutting_tool_shapes.append(box)
+                cutting_planes.append(('z', pos_z))
+
+        if not cutting_tool_shapes:
+             raise ValueError("Object needs splitting based on orientation fit, but no cutting tools generated.")
+
+        # Execute Split Operation using sequential Part.cut with boxes
+        FreeCAD.Console.PrintMessage(f"Attempting splitting using Part.cut with {len(cutting_tool_shapes)} box tool(s)...\n")
+
+        # Start with the original shape
+        current_pieces = [shape_to_split]
 
         try:
-            # --- Get Inputs ---
-            printer_x = float(self.printer_x_input.text())
-            printer_y = float(self.printer_y_input.text())
-            printer_z = float(self.printer_z_input.text())
-            printer_dims = (printer_x, printer_y, printer_z)
+            # Iterate through each calculated cutting tool shape (box)
+            for i, tool_shape in enumerate(cutting_tool_shapes):
+                FreeCAD.Console.PrintMessage(f"  Applying cut with tool {i+1}...\n")
+                next_pieces = [] # Store results of cutting with this tool
+                for piece in current_pieces:
+                    if piece.isNull() or not isinstance(piece, Part.Solid):
+                        continue # Skip invalid pieces
+
+                    # --- Add validity check before cutting ---
+                    try:
+                        piece.check() # Check if the piece is geometrically valid
+                        # FreeCAD.Console.PrintMessage(f"    Piece valid before cut {i+1}. Volume: {piece.Volume:.2f}")
+                    except Exception as check_err:
+                        FreeCAD.Console.PrintWarning(f"    Piece invalid BEFORE cut {i+1}: {check_err}. Skipping this piece.")
+                        next_pieces.append(piece) # Keep the invalid piece?
+                        continue
+                    # -------------------------------------------
+
+                    # Perform the cut
+                    try:
+                        # Use the box shape as the cutting tool (timeout + retry ladder)
+                        cut_result, cut_step = booleans.cut(piece, tool_shape, plane=cutting_planes[i])
+                    except Part.OCCError as cut_err:
+                         FreeCAD.Console.PrintWarning(f"    Part.cut operation failed for tool {i+1} on a piece: {cut_err}. Keeping piece.")
+                         next_pieces.append(piece) # Keep the piece uncut if cut fails
+                         continue
+                    except Exception as general_cut_err:
+                         FreeCAD.Console.PrintWarning(f"    Unexpected error during Part.cut for tool {i+1}: {general_cut_err}. Keeping piece.")
+                         next_pieces.append(piece)
+                         continue
+
+                    # Process the result of the cut
+                    # (Keep the existing logic for processing cut_result: checking Solids, Volume etc.)
+                    if cut_result and not cut_result.isNull() and hasattr(cut_result, 'Solids') and cut_result.Solids:
+                         valid_fragments = [s for s in cut_result.Solids if not s.isNull() and s.Volume > 1e-9]
+                         if valid_fragments:
+                              next_pieces.extend(valid_fragments)
+                         else:
+                              FreeCAD.Console.PrintWarning(f"    Cut resulted in compound but no valid solid fragments for tool {i+1}. Keeping original piece.")
+                              next_pieces.append(piece)
+                    elif cut_result and isinstance(cut_result, Part.Solid):
+                          next_pieces.append(cut_result)
+                    else:
+                         FreeCAD.Console.PrintWarning(f"    Cut with tool {i+1} failed or yielded no solids. Keeping original piece.")
+                         next_pieces.append(piece)
+
+                # Update the list of pieces for the next tool cut
+                current_pieces = next_pieces
+                if not current_pieces:
+                     FreeCAD.Console.PrintError("  Lost all pieces during cutting process! Aborting.\n")
+                     raise ValueError("Splitting process resulted in no pieces.")
+
+            # Final pieces are in current_pieces
+            initial_solid_pieces_shapes = [p for p in current_pieces if isinstance(p, Part.Solid) and not p.isNull() and p.Volume > 1e-9]
+            FreeCAD.Console.PrintMessage(f"Sequential cutting finished. Found {len(initial_solid_pieces_shapes)} potential solids.\n")
+
+        except Exception as cut_process_err:
+            FreeCAD.Console.PrintError(f"Error during Part.cut process: {cut_process_err}\n")
+            import traceback
+            traceback.print_exc()
+            raise ValueError(f"Error during cutting process: {cut_process_err}")
+
+        return initial_solid_pieces_shapes
+
+    # --- Splitting Mode: Recursive Fit-Driven (kd-tree) ---
+    def recursive_split(self, piece, printer_dims, booleans, depth=0):
+        """
+        Splits piece only while it does not fit, choosing the split axis and position
+        from the piece's own bbox. Returns the list of resulting solids.
+        Raises ValueError if a piece that still does not fit cannot be split further.
+        """
+        bbox = piece.BoundBox
+        if self.check_fit(bbox, printer_dims):
+            return [piece]
+        if depth >= MAX_RECURSION_DEPTH:
+            raise ValueError(f"Recursive splitting reached the maximum depth ({MAX_RECURSION_DEPTH}) and a piece still does not fit (BBox: X={bbox.XLength:.1f}, Y={bbox.YLength:.1f}, Z={bbox.ZLength:.1f}). Try the uniform grid mode.")
+
+        # Compare dimensions sorted largest first: the first one that exceeds its
+        # printer counterpart is the axis to split (check_fit allows any orientation)
+        lengths = {'x': bbox.XLength, 'y': bbox.YLength, 'z': bbox.ZLength}
+        mins = {'x': bbox.XMin, 'y': bbox.YMin, 'z': bbox.ZMin}
+        sorted_axes = sorted(lengths, key=lengths.get, reverse=True)
+        sorted_limits = sorted(printer_dims, reverse=True)
+        axis, limit = sorted_axes[0], sorted_limits[0]
+        for candidate, candidate_limit in zip(sorted_axes, sorted_limits):
+            if lengths[candidate] > candidate_limit + 1e-6:
+                axis, limit = candidate, candidate_limit
+                break
+
+        # Split into equal steps no longer than the limit, cutting near the middle
+        length = lengths[axis]
+        num_parts = max(2, int(math.ceil(length / limit)))
+        step = length / num_parts
+        position = mins[axis] + (num_parts // 2) * step
+
+        tool_thickness = 0.001 # Very small thickness for the cutting box
+        tool_buffer = bbox.DiagonalLength * 2
+        size = {a: tool_buffer for a in 'xyz'}
+        size[axis] = tool_thickness
+        corner = Base.Vector(bbox.Center.x - size['x'] / 2, bbox.Center.y - size['y'] / 2, bbox.Center.z - size['z'] / 2)
+        setattr(corner, axis, position - tool_thickness / 2)
+        tool_shape = Part.makeBox(size['x'], size['y'], size['z'], corner)
+
+        FreeCAD.Console.PrintMessage(f"  {'  ' * depth}Cutting piece along {axis.upper()} at {position:.2f} (depth {depth+1})...\n")
+        cut_result, cut_step = booleans.cut(piece, tool_shape, plane=(axis, position))
+        fragments = [s for s in cut_result.Solids if not s.isNull() and s.Volume > 1e-9] if cut_result else []
+        if len(fragments) < 2:
+            raise ValueError(f"Recursive splitting failed: the cut along {axis.upper()} at {position:.2f} did not split a piece that does not fit (BBox: X={bbox.XLength:.1f}, Y={bbox.YLength:.1f}, Z={bbox.ZLength:.1f}).")
+
+        result = []
+        for fragment in fragments:
+            result.extend(self.recursive_split(fragment, printer_dims, booleans, depth + 1))
+        return result
 
-            add_connectors = self.connector_group.isChecked()
-            pin_diameter = float(self.pin_diameter_input.text()) if add_connectors else 0
-            pin_height = float(self.pin_height_input.text()) if add_connectors else 0
-            tolerance = float(self.tolerance_input.text()) if add_connectors else 0
+    # --- Main Processing Function ---
+    def process(self):
+        """ Splits every selected object, one transaction per object """
+        try:
+            settings = self.read_settings()
+            if not self.objs_to_split:
+                raise ValueError("No object selected.")
+        except ValueError as ve:
+            FreeCAD.Console.PrintError(f"Processing Error: {ve}\n")
+            QtGui.QMessageBox.critical(None, "Error", f"{ve}")
+            return
+
+        printer_x, printer_y, printer_z = settings['printer_dims']
+        FreeCAD.Console.PrintMessage(f"Printer Volume: X={printer_x:.2f}, Y={printer_y:.2f}, Z={printer_z:.2f}\n")
+        FreeCAD.Console.PrintMessage(f"Splitting Mode: {settings['split_mode']}\n")
+        if settings['add_connectors']:
+             FreeCAD.Console.PrintMessage(f"Connectors: Enabled (Dia={settings['pin_diameter']:.2f}, Height={settings['pin_height']:.2f}, Tol={settings['tolerance']:.2f})\n")
+        else:
+             FreeCAD.Console.PrintMessage("Connectors: Disabled\n")
+
+        jobs = self.build_job_queue(self.objs_to_split)
+        # Shared by every job so the retry statistics cover the whole batch
+        self.boolean_executor = BooleanExecutor(timeout=settings['boolean_timeout'], isolated=settings['isolated_booleans'])
+        succeeded = [] # (label, piece count)
+        already_fit = [] # labels
+        failed = [] # (label, error message)
 
-            if add_connectors and (pin_diameter <= 0 or pin_height <= 0):
-                 raise ValueError("Pin diameter and height must be positive if adding connectors.")
+        try:
+            for job_index, obj in enumerate(jobs):
+                FreeCAD.Console.PrintMessage(f"--- Job {job_index+1}/{len(jobs)}: {obj.Label} ---\n")
+                FreeCAD.ActiveDocument.openTransaction(f"Split {obj.Label}") # One transaction per object
+                try:
+                    valid_pieces_count = self.split_object(obj, settings)
+                    if valid_pieces_count:
+                        FreeCAD.ActiveDocument.commitTransaction() # COMMIT CHANGES
+                        succeeded.append((obj.Label, valid_pieces_count))
+                    else:
+                        FreeCAD.ActiveDocument.abortTransaction()
+                        already_fit.append(obj.Label)
+                except ValueError as ve: # Catch specific logical/input errors
+                    FreeCAD.ActiveDocument.abortTransaction()
+                    FreeCAD.Console.PrintError(f"Processing Error ({obj.Label}): {ve}\n")
+                    failed.append((obj.Label, f"{ve}"))
+                except Part.OCCError as occ_err: # Catch geometry kernel errors
+                    FreeCAD.ActiveDocument.abortTransaction()
+                    FreeCAD.Console.PrintError(f"Geometry Engine Error ({obj.Label}): {occ_err}\n")
+                    import traceback
+                    traceback.print_exc()
+                    failed.append((obj.Label, f"A geometry error occurred: {occ_err}"))
+                except Exception as e: # Catch any other unexpected errors
+                    FreeCAD.ActiveDocument.abortTransaction()
+                    FreeCAD.Console.PrintError(f"Unexpected Error ({obj.Label}): {e}\n")
+                    import traceback
+                    traceback.print_exc()
+                    failed.append((obj.Label, f"An unexpected error occurred: {e}"))
+        finally:
+             FreeCAD.Console.PrintMessage(self.boolean_executor.summary() + "\n")
+             self.boolean_executor.close() # Stop the worker process, if any
+             # Final recompute and close panel
+             try: FreeCAD.ActiveDocument.recompute()
+             except: FreeCAD.Console.PrintError("Error during final recompute.\n")
+             self.close()
 
-            if not self.obj_to_split:
-                raise ValueError("No object selected.")
+        # --- Summary ---
+        lines = [f"{label}: {count} piece(s)" for label, count in succeeded]
+        lines += [f"{label}: already fits, not split" for label in already_fit]
+        lines += [f"{label}: FAILED - {msg}" for label, msg in failed]
+        summary = "\n".join(lines)
+        if failed:
+            QtGui.QMessageBox.critical(None, "Error", summary)
+        elif succeeded:
+            QtGui.QMessageBox.information(None, "Success", summary)
+        else:
+            QtGui.QMessageBox.information(None, "Info", "The selected object(s) already fit within the specified printer volume.")
+
+    # --- Per-Object Split Job ---
+    def split_object(self, obj_to_split, settings):
+        """
+        Splits one object using the shared settings. The caller owns the transaction.
+        Returns the number of pieces created, or 0 if the object already fits.
+        Raises ValueError / Part.OCCError on failure.
+        """
+        printer_dims = settings['printer_dims']
+        printer_x, printer_y, printer_z = printer_dims
+        split_mode = settings['split_mode']
+        add_connectors = settings['add_connectors']
+        pin_diameter = settings['pin_diameter']
+        pin_height = settings['pin_height']
+        tolerance = settings['tolerance']
+        booleans = self.boolean_executor
 
-            FreeCAD.Console.PrintMessage(f"Starting process for: {self.obj_to_split.Label}\n")
-            FreeCAD.Console.PrintMessage(f"Printer Volume: X={printer_x:.2f}, Y={printer_y:.2f}, Z={printer_z:.2f}\n")
-            if add_connectors:
-                 FreeCAD.Console.PrintMessage(f"Connectors: Enabled (Dia={pin_diameter:.2f}, Height={pin_height:.2f}, Tol={tolerance:.2f})\n")
-            else:
-                 FreeCAD.Console.PrintMessage("Connectors: Disabled\n")
+        piece_objects = [] # Keep track of created Part::Feature objects
+        result_group = None # Group for results
+        temp_cutter_obj = None # For temporary cutter features
 
+        try:
+            FreeCAD.Console.PrintMessage(f"Starting process for: {obj_to_split.Label}\n")
 
             # --- Get the initial shape ---
-            initial_shape = self.obj_to_split.Shape
+            initial_shape = obj_to_split.Shape
             shape_to_split = None # Initialize
 
             # --- Attempt to convert to solid ---
@@ -242,8 +602,8 @@ class PrintSplitterTaskPanel:
                  raise ValueError("Could not obtain a valid shape from the selected object after conversion attempt.")
 
             # --- Initial Splitting Checks (using the potentially converted shape) ---
-            # shape_to_split = self.obj_to_split.Shape # This line is replaced by the logic above
-            global_bbox = shape_to_split.BoundBox.transformed(self.obj_to_split.Placement.Matrix)
+            # shape_to_split = obj_to_split.Shape # This line is replaced by the logic above
+            global_bbox = shape_to_split.BoundBox.transformed(obj_to_split.Placement.Matrix)
             needs_split_x = global_bbox.XLength > printer_x
             needs_split_y = global_bbox.YLength > printer_y
             needs_split_z = global_bbox.ZLength > printer_z
@@ -253,123 +613,28 @@ class PrintSplitterTaskPanel:
                  local_bbox = shape_to_split.BoundBox # Use local bbox for fitting check
                  if self.check_fit(local_bbox, printer_dims):
                      FreeCAD.Console.PrintWarning("Object already fits within the printer volume. No splitting needed.\n")
-                     QtGui.QMessageBox.information(None, "Info", "The selected object already fits within the specified printer volume.")
-                     FreeCAD.ActiveDocument.abortTransaction()
-                     self.close()
-                     return
+                     return 0
                  else:
                       FreeCAD.Console.PrintWarning("Object bounding box exceeds printer volume in all orientations, even though individual dimensions might be smaller. Proceeding with split based on dimensions.\n")
                       # Fall through to splitting based on dimensions comparison
 
-            # Calculate and Create Cutting TOOLS (Boxes instead of Planes)
-            cutting_tool_shapes = []
-            tool_buffer = max(global_bbox.XLength, global_bbox.YLength, global_bbox.ZLength) * 2 # Even larger buffer for boxes
-            tool_thickness = 0.001 # Very small thickness for the cutting box
-
-            # X Cuts - Create Boxes
-            num_cuts_x = int(math.ceil(global_bbox.XLength / printer_x)) - 1 if needs_split_x else 0
-            if num_cuts_x > 0:
-                step_x = global_bbox.XLength / (num_cuts_x + 1)
-                for i in range(1, num_cuts_x + 1):
-                    pos_x = global_bbox.XMin + i * step_x
-                    # Center the box on the cut plane, make it large in Y/Z, thin in X
-                    center_vec = Base.Vector(pos_x, global_bbox.Center.y, global_bbox.Center.z)
-                    box = Part.makeBox(tool_thickness, tool_buffer, tool_buffer, center_vec)
-                    # Adjust position so the center is on the cut plane
-                    box.translate(Base.Vector(-tool_thickness / 2, -tool_buffer / 2, -tool_buffer / 2))
-                    cutting_tool_shapes.append(box)
-            # Y Cuts - Create Boxes
-            num_cuts_y = int(math.ceil(global_bbox.YLength / printer_y)) - 1 if needs_split_y else 0
-            if num_cuts_y > 0:
-                step_y = global_bbox.YLength / (num_cuts_y + 1)
-                for i in range(1, num_cuts_y + 1):
-                    pos_y = global_bbox.YMin + i * step_y
-                    center_vec = Base.Vector(global_bbox.Center.x, pos_y, global_bbox.Center.z)
-                    box = Part.makeBox(tool_buffer, tool_thickness, tool_buffer, center_vec)
-                    box.translate(Base.Vector(-tool_buffer / 2, -tool_thickness / 2, -tool_buffer / 2))
-                    cutting_tool_shapes.append(box)
-            # Z Cuts - Create Boxes
-            num_cuts_z = int(math.ceil(global_bbox.ZLength / printer_z)) - 1 if needs_split_z else 0
-            if num_cuts_z > 0:
-                step_z = global_bbox.ZLength / (num_cuts_z + 1)
-                for i in range(1, num_cuts_z + 1):
-                    pos_z = global_bbox.ZMin + i * step_z
-                    center_vec = Base.Vector(global_bbox.Center.x, global_bbox.Center.y, pos_z)
-                    box = Part.makeBox(tool_buffer, tool_buffer, tool_thickness, center_vec)
-                    box.translate(Base.Vector(-tool_buffer / 2, -tool_buffer / 2, -tool_thickness / 2))
-                    cutting_tool_shapes.append(box)
-
-            if not cutting_tool_shapes:
-                 raise ValueError("Object needs splitting based on orientation fit, but no cutting tools generated.")
-
-            # Execute Split Operation using sequential Part.cut with boxes
-            FreeCAD.Console.PrintMessage(f"Attempting splitting using Part.cut with {len(cutting_tool_shapes)} box tool(s)...\n")
-
-            # Start with the original shape
-            current_pieces = [shape_to_split]
-
-            try:
-                # Iterate through each calculated cutting tool shape (box)
-                for i, tool_shape in enumerate(cutting_tool_shapes):
-                    FreeCAD.Console.PrintMessage(f"  Applying cut with tool {i+1}...\n")
-                    next_pieces = [] # Store results of cutting with this tool
-                    for piece in current_pieces:
-                        if piece.isNull() or not isinstance(piece, Part.Solid):
-                            continue # Skip invalid pieces
-
-                        # --- Add validity check before cutting ---
-                        try:
-                            piece.check() # Check if the piece is geometrically valid
-                            # FreeCAD.Console.PrintMessage(f"    Piece valid before cut {i+1}. Volume: {piece.Volume:.2f}")
-                        except Exception as check_err:
-                            FreeCAD.Console.PrintWarning(f"    Piece invalid BEFORE cut {i+1}: {check_err}. Skipping this piece.")
-                            next_pieces.append(piece) # Keep the invalid piece?
-                            continue
-                        # -------------------------------------------
-
-                        # Perform the cut
-                        try:
-                            # Use the box shape as the cutting tool
-                            cut_result = piece.cut(tool_shape)
-                        except Part.OCCError as cut_err:
-                             FreeCAD.Console.PrintWarning(f"    Part.cut operation failed for tool {i+1} on a piece: {cut_err}. Keeping piece.")
-                             next_pieces.append(piece) # Keep the piece uncut if cut fails
-                             continue
-                        except Exception as general_cut_err:
-                             FreeCAD.Console.PrintWarning(f"    Unexpected error during Part.cut for tool {i+1}: {general_cut_err}. Keeping piece.")
-                             next_pieces.append(piece)
-                             continue
-
-                        # Process the result of the cut
-                        # (Keep the existing logic for processing cut_result: checking Solids, Volume etc.)
-                        if cut_result and not cut_result.isNull() and hasattr(cut_result, 'Solids') and cut_result.Solids:
-                             valid_fragments = [s for s in cut_result.Solids if not s.isNull() and s.Volume > 1e-9]
-                             if valid_fragments:
-                                  next_pieces.extend(valid_fragments)
-                             else:
-                                  FreeCAD.Console.PrintWarning(f"    Cut resulted in compound but no valid solid fragments for tool {i+1}. Keeping original piece.")
-                                  next_pieces.append(piece)
-                        elif cut_result and isinstance(cut_result, Part.Solid):
-                              next_pieces.append(cut_result)
-                        else:
-                             FreeCAD.Console.PrintWarning(f"    Cut with tool {i+1} failed or yielded no solids. Keeping original piece.")
-                             next_pieces.append(piece)
-
-                    # Update the list of pieces for the next tool cut
-                    current_pieces = next_pieces
-                    if not current_pieces:
-                         FreeCAD.Console.PrintError("  Lost all pieces during cutting process! Aborting.\n")
-                         raise ValueError("Splitting process resulted in no pieces.")
-
-                # Final pieces are in current_pieces
-                initial_solid_pieces_shapes = [p for p in current_pieces if isinstance(p, Part.Solid) and not p.isNull() and p.Volume > 1e-9]
-                FreeCAD.Console.PrintMessage(f"Sequential cutting finished. Found {len(initial_solid_pieces_shapes)} potential solids.\n")
-
-            except Exception as cut_process_err:
-                FreeCAD.Console.PrintError(f"Error during Part.cut process: {cut_process_err}\n")
-                import traceback
-                traceback.print_exc()
-                raise ValueError(f"Error during cutting process: {cut_process_err}")
+            # Pins stick out pin_height beyond a cut face (always towards +X/+Y/+Z),
+            # so reserve that room in every direction when computing the split
+            if add_connectors:
+                split_dims = tuple(d - pin_height for d in printer_dims)
+                FreeCAD.Console.PrintMessage(f"Reserving {pin_height:.2f} mm per axis for connector pins.\n")
+            else:
+                split_dims = printer_dims
+
+            if split_mode == SPLIT_MODE_RECURSIVE:
+                if self.check_fit(shape_to_split.BoundBox, printer_dims):
+                    FreeCAD.Console.PrintWarning("Object already fits within the printer volume in another orientation. No splitting needed.\n")
+                    return 0
+                FreeCAD.Console.PrintMessage("Splitting recursively until every piece fits...\n")
+                initial_solid_pieces_shapes = self.recursive_split(shape_to_split, split_dims, booleans)
+                FreeCAD.Console.PrintMessage(f"Recursive splitting finished. Found {len(initial_solid_pieces_shapes)} potential solids.\n")
+            else:
+                initial_solid_pieces_shapes = self.grid_split(shape_to_split, global_bbox, split_dims, booleans)
 
             if not initial_solid_pieces_shapes:
                  raise ValueError("Sequential cutting resulted in zero valid solid pieces.")
@@ -387,32 +652,35 @@ class PrintSplitterTaskPanel:
 
                 for i in range(len(initial_solid_pieces_shapes)):
                     for j in range(i + 1, len(initial_solid_pieces_shapes)):
-                        shape1 = current_piece_shapes[i]
-                        shape2 = current_piece_shapes[j]
-
-                        matching_indices = self.find_matching_planar_faces(shape1, shape2, tolerance=0.1) # Increased tolerance for matching
+                        # The interface must hold a disc of the hole diameter around the pin
+                        matches = self.find_matching_planar_faces(current_piece_shapes[i], current_piece_shapes[j], tolerance=0.1, connector_radius=hole_diameter / 2) # Increased tolerance for matching
 
-                        if matching_indices:
-                            FreeCAD.Console.PrintMessage(f"    Found {len(matching_indices)} potential interface pair(s) between piece {i+1} and piece {j+1}. Checking...")
+                        if matches:
+                            FreeCAD.Console.PrintMessage(f"    Found {len(matches)} potential interface pair(s) between piece {i+1} and piece {j+1}. Checking...")
 
-                            for face1_idx, face2_idx in matching_indices:
+                            for face1_idx, face2_idx, center_point, normal_vec in matches:
+                                interface_key = (i, j, face1_idx, face2_idx)
                                 # --- DEBUG --- 
                                 FreeCAD.Console.PrintMessage(f"      Processing interface pair: Piece {i+1} (Face {face1_idx}) <-> Piece {j+1} (Face {face2_idx})")
                                 # ------------- 
                                 try:
-                                    face1 = shape1.Faces[face1_idx]
-                                    face2 = shape2.Faces[face2_idx] # Not strictly needed but good for check
-
-                                    center_point = face1.CenterOfMass
-                                    normal_vec = face1.normalAt(face1.Surface.parameter(center_point)[0], face1.Surface.parameter(center_point)[1])
+                                    # Pins always point towards +X/+Y/+Z, so a piece grows by at most
+                                    # pin_height per axis (reserved when the split was computed).
+                                    # normal_vec is the outward normal of piece i's face, pointing into piece j.
+                                    if normal_vec.x + normal_vec.y + normal_vec.z >= 0:
+                                        pin_idx, hole_idx, pin_dir = i, j, normal_vec
+                                    else:
+                                        pin_idx, hole_idx, pin_dir = j, i, -normal_vec
+                                    pin_shape = current_piece_shapes[pin_idx]
+                                    hole_shape = current_piece_shapes[hole_idx]
 
-                                    # Create Pin (aligned with face1 normal)
-                                    pin_placement = Base.Placement(center_point, Base.Rotation(Base.Vector(0,0,1), normal_vec))
+                                    # Create Pin at the centre of the overlap, sticking out of the pin piece
+                                    pin_placement = Base.Placement(center_point, Base.Rotation(Base.Vector(0,0,1), pin_dir))
                                     pin = Part.makeCylinder(pin_diameter / 2, pin_height, Base.Vector(0,0,0), Base.Vector(0,0,1))
                                     pin.Placement = pin_placement
 
-                                    # Create Hole Cutter (aligned with face2 normal = -face1 normal)
-                                    hole_placement = Base.Placement(center_point, Base.Rotation(Base.Vector(0,0,1), -normal_vec))
+                                    # Create Hole Cutter along the same direction, into the hole piece
+                                    hole_placement = Base.Placement(center_point, Base.Rotation(Base.Vector(0,0,1), pin_dir))
                                     hole_cutter = Part.makeCylinder(hole_diameter / 2, hole_depth, Base.Vector(0,0,0), Base.Vector(0,0,1))
                                     hole_cutter.Placement = hole_placement
 
@@ -420,45 +688,37 @@ class PrintSplitterTaskPanel:
                                     FreeCAD.Console.PrintMessage(f"        Pin Dia: {pin_diameter:.2f}, Hole Dia: {hole_diameter:.2f}, Center: ({center_point.x:.1f},{center_point.y:.1f},{center_point.z:.1f}) ")
                                     # ------------- 
 
-                                    # Apply Booleans (Object 'i' gets pin, Object 'j' gets hole)
-                                    FreeCAD.Console.PrintMessage(f"        Applying fuse pin to piece {i+1}...")
-                                    new_shape1 = shape1.fuse(pin)
+                                    # Apply Booleans (pin piece gets the pin, hole piece gets the hole)
+                                    FreeCAD.Console.PrintMessage(f"        Applying fuse pin to piece {pin_idx+1}...")
+                                    new_pin_shape, fuse_step = booleans.fuse(pin_shape, pin)
                                     fuse_success = False
-                                    if not new_shape1.isNull() and new_shape1.isValid():
-                                        # Relaxed volume check (allow small discrepancies)
-                                        #if new_shape1.Volume < shape1.Volume - 1e-3:
-                                        #    FreeCAD.Console.PrintWarning(f"        Fuse resulted in significant volume decrease for piece {i+1}. Treating as failure.")
-                                        #else:
+                                    if new_pin_shape is not None and not new_pin_shape.isNull() and new_pin_shape.isValid():
                                         fuse_success = True
-                                        FreeCAD.Console.PrintMessage(f"        Fuse successful for piece {i+1}.")
+                                        FreeCAD.Console.PrintMessage(f"        Fuse successful for piece {pin_idx+1}.")
                                     else:
-                                        FreeCAD.Console.PrintWarning(f"        Fuse failed or invalid for pin on piece {i+1}. Skipping connector.")
+                                        FreeCAD.Console.PrintWarning(f"        Fuse failed or invalid for pin on piece {pin_idx+1}. Skipping connector.")
 
                                     # Proceed only if fuse was successful
                                     if fuse_success:
-                                        FreeCAD.Console.PrintMessage(f"        Applying cut hole from piece {j+1}...")
-                                        new_shape2 = shape2.cut(hole_cutter)
+                                        FreeCAD.Console.PrintMessage(f"        Applying cut hole from piece {hole_idx+1}...")
+                                        new_hole_shape, cut_step = booleans.cut(hole_shape, hole_cutter)
                                         cut_success = False
-                                        if not new_shape2.isNull() and new_shape2.isValid():
-                                            # Relaxed volume check
-                                            #if new_shape2.Volume > shape2.Volume + 1e-3:
-                                            #     FreeCAD.Console.PrintWarning(f"        Cut resulted in significant volume increase for piece {j+1}. Treating as failure.")
-                                            #else:
+                                        if new_hole_shape is not None and not new_hole_shape.isNull() and new_hole_shape.isValid():
                                             cut_success = True
-                                            FreeCAD.Console.PrintMessage(f"        Cut successful for piece {j+1}.")
+                                            FreeCAD.Console.PrintMessage(f"        Cut successful for piece {hole_idx+1}.")
                                         else:
-                                             FreeCAD.Console.PrintWarning(f"        Cut failed or invalid for hole on piece {j+1}. Skipping connector.")
+                                             FreeCAD.Console.PrintWarning(f"        Cut failed or invalid for hole on piece {hole_idx+1}. Skipping connector.")
 
                                         # Update shapes ONLY if BOTH operations succeeded
                                         if cut_success:
-                                            current_piece_shapes[i] = new_shape1
-                                            current_piece_shapes[j] = new_shape2
+                                            current_piece_shapes[pin_idx] = new_pin_shape
+                                            current_piece_shapes[hole_idx] = new_hole_shape
                                             processed_interface_pairs.add(interface_key) # Mark as processed
                                             FreeCAD.Console.PrintMessage(f"        Connector added successfully to pair ({i+1}, {j+1}).\n")
                                         else:
-                                             FreeCAD.Console.PrintWarning(f"        Cut failed for piece {j+1}, connector NOT added to pair ({i+1}, {j+1}).\n")
+                                             FreeCAD.Console.PrintWarning(f"        Cut failed for piece {hole_idx+1}, connector NOT added to pair ({i+1}, {j+1}).\n")
                                     else:
-                                         FreeCAD.Console.PrintWarning(f"        Fuse failed for piece {i+1}, connector NOT added to pair ({i+1}, {j+1}).\n")
+                                         FreeCAD.Console.PrintWarning(f"        Fuse failed for piece {pin_idx+1}, connector NOT added to pair ({i+1}, {j+1}).\n")
 
                                 except Exception as conn_err:
                                     FreeCAD.Console.PrintWarning(f"    Error applying connector for interface {interface_key}: {conn_err}\n")
@@ -493,12 +753,12 @@ class PrintSplitterTaskPanel:
 
             # --- Create Final Objects ---
             FreeCAD.Console.PrintMessage("Creating final objects for valid pieces...\n")
-            result_group = FreeCAD.ActiveDocument.addObject('App::DocumentObjectGroup', f"{self.obj_to_split.Name}_SplitResult")
-            original_obj_gui = FreeCADGui.ActiveDocument.getObject(self.obj_to_split.Name)
+            result_group = FreeCAD.ActiveDocument.addObject('App::DocumentObjectGroup', f"{obj_to_split.Name}_SplitResult")
+            original_obj_gui = FreeCADGui.ActiveDocument.getObject(obj_to_split.Name)
             valid_pieces_count = 0
 
             for i, final_shape in final_valid_shapes.items():
-                 piece_name = f"{self.obj_to_split.Name}_split_{i+1}"
+                 piece_name = f"{obj_to_split.Name}_split_{i+1}"
                  new_piece_obj = FreeCAD.ActiveDocument.addObject("Part::Feature", piece_name)
                  new_piece_obj.Shape = final_shape
                  piece_objects.append(new_piece_obj) # Add to list for potential future use
@@ -523,34 +783,13 @@ class PrintSplitterTaskPanel:
             # --- Finalize ---
             FreeCAD.Console.PrintMessage(f"Successfully created {valid_pieces_count} final piece(s).\n")
             if original_obj_gui: original_obj_gui.Visibility = False # Hide original
-            FreeCAD.ActiveDocument.commitTransaction() # COMMIT CHANGES
-            QtGui.QMessageBox.information(None, "Success", f"Object successfully processed into {valid_pieces_count} pieces.")
+            return valid_pieces_count
 
-        except ValueError as ve: # Catch specific logical/input errors
-            FreeCAD.ActiveDocument.abortTransaction()
-            FreeCAD.Console.PrintError(f"Processing Error: {ve}\n")
-            QtGui.QMessageBox.critical(None, "Error", f"{ve}")
-        except Part.OCCError as occ_err: # Catch geometry kernel errors
-            FreeCAD.ActiveDocument.abortTransaction()
-            FreeCAD.Console.PrintError(f"Geometry Engine Error: {occ_err}\n")
-            import traceback
-            traceback.print_exc()
-            QtGui.QMessageBox.critical(None, "Geometry Error", f"A geometry error occurred:\n{occ_err}\nCheck Report View.")
-        except Exception as e: # Catch any other unexpected errors
-            FreeCAD.ActiveDocument.abortTransaction()
-            FreeCAD.Console.PrintError(f"Unexpected Error: {e}\n")
-            import traceback
-            traceback.print_exc()
-            QtGui.QMessageBox.critical(None, "Error", f"An unexpected error occurred:\n{e}")
         finally:
              # Clean up temporary objects just in case they weren't removed
              if temp_cutter_obj and temp_cutter_obj.Name in FreeCAD.ActiveDocument.Objects:
                  try: FreeCAD.ActiveDocument.removeObject(temp_cutter_obj.Name)
                  except: pass
-             # Final recompute and close panel
-             try: FreeCAD.ActiveDocument.recompute()
-             except: FreeCAD.Console.PrintError("Error during final recompute.\n")
-             self.close()
 
 
 # --- End of PrintSplitterTaskPanel.py --- 
\ No newline at end of file
@@ -0,0 +1,71 @@
+# tests/benchmark_booleans.py
+
+# Measures the overhead of running booleans in the isolated worker process
+# compared to in-process, on a model that needs several grid cuts.
+# Requires FreeCAD. Run with:  FreeCADCmd tests/benchmark_booleans.py
+
+import os
+import sys
+import time
+
+ADDON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "PrintSplitterAddon")
+if ADDON_DIR not in sys.path:
+    sys.path.insert(0, ADDON_DIR)
+
+import Part
+from FreeCAD import Base
+from PrintSplitterBooleans import BooleanExecutor
+
+MODEL_SIZE = 500.0 # mm, cube side
+CUT_STEP = 200.0 # mm, gives 2 cuts per axis
+TOOL_THICKNESS = 0.001
+
+def make_model():
+    """ A cube with a cylindrical hole, so the booleans are not trivial """
+    cube = Part.makeBox(MODEL_SIZE, MODEL_SIZE, MODEL_SIZE)
+    hole = Part.makeCylinder(MODEL_SIZE / 4, MODEL_SIZE, Base.Vector(MODEL_SIZE / 2, MODEL_SIZE / 2, 0))
+    return cube.cut(hole)
+
+def make_tools():
+    """ Thin boxes on every grid plane, like PrintSplitterTaskPanel.grid_split """
+    buffer = MODEL_SIZE * 4
+    tools = []
+    for axis in "xyz":
+        position = CUT_STEP
+        while position < MODEL_SIZE:
+            size = {a: buffer for a in "xyz"}
+            size[axis] = TOOL_THICKNESS
+            corner = Base.Vector(-buffer / 2 + MODEL_SIZE / 2, -buffer / 2 + MODEL_SIZE / 2, -buffer / 2 + MODEL_SIZE / 2)
+            setattr(corner, axis, position - TOOL_THICKNESS / 2)
+            tools.append((Part.makeBox(size["x"], size["y"], size["z"], corner), (axis, position)))
+            position += CUT_STEP
+    return tools
+
+def split(executor):
+    """ Applies every tool to every piece and returns (piece count, boolean count) """
+    pieces = [make_model()]
+    booleans = 0
+    for tool, plane in make_tools():
+        next_pieces = []
+        for piece in pieces:
+            result, step = executor.cut(piece, tool, plane=plane)
+            booleans += 1
+            next_pieces.extend(result.Solids if result else [piece])
+        pieces = next_pieces
+    return len(pieces), booleans
+
+def benchmark(isolated):
+    executor = BooleanExecutor(isolated=isolated)
+    start_time = time.perf_counter()
+    try:
+        piece_count, boolean_count = split(executor)
+    finally:
+        executor.close()
+    elapsed = time.perf_counter() - start_time
+    print(f"{'isolated  ' if isolated else 'in-process'}: {elapsed:.2f} s for {boolean_count} booleans ({piece_count} pieces)")
+    return elapsed
+
+in_process = benchmark(False)
+isolated = benchmark(True)
+print(f"Isolation overhead: {isolated - in_process:.2f} s total")
+os._exit(0) # Keep FreeCADCmd from entering its console
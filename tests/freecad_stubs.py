@@ -0,0 +1,57 @@
+# tests/freecad_stubs.py
+
+# Minimal FreeCAD / FreeCADGui / Part / PySide stand-ins so the addon's pure
+# logic can be imported and tested without a FreeCAD install.
+
+import os
+import sys
+import types
+import importlib
+
+ADDON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "PrintSplitterAddon")
+
+# Addon modules that are re-imported against fresh stubs
+ADDON_MODULES = ["PrintSplitterTaskPanel", "PrintSplitterBooleans", "PrintSplitterBooleanWorker"]
+
+class Vector:
+    """ Small subset of FreeCAD.Base.Vector """
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x, self.y, self.z = x, y, z
+    def __add__(self, other): return Vector(self.x + other.x, self.y + other.y, self.z + other.z)
+    def __sub__(self, other): return Vector(self.x - other.x, self.y - other.y, self.z - other.z)
+    def __mul__(self, k): return Vector(self.x * k, self.y * k, self.z * k)
+    def __neg__(self): return self * -1
+    def dot(self, other): return self.x * other.x + self.y * other.y + self.z * other.z
+
+def install():
+    """ Puts the stubs in sys.modules and makes the addon importable """
+    messages = []
+    freecad = types.ModuleType("FreeCAD")
+    freecad.Console = types.SimpleNamespace(PrintMessage=messages.append, PrintWarning=messages.append, PrintError=messages.append)
+    freecad.messages = messages # Everything logged, for assertions
+    freecad.ActiveDocument = None
+    freecad.getHomePath = lambda: "/nonexistent"
+    freecad.Base = types.SimpleNamespace(Vector=Vector)
+
+    part = types.ModuleType("Part")
+    part.Shape = object
+    part.makeBox = lambda *args: types.SimpleNamespace(args=args)
+
+    pyside = types.ModuleType("PySide")
+    qt_core = types.ModuleType("PySide.QtCore")
+    qt_core.QT_TRANSLATE_NOOP = lambda context, text: text
+    qt_gui = types.ModuleType("PySide.QtGui")
+    pyside.QtCore, pyside.QtGui = qt_core, qt_gui
+
+    sys.modules.update({"FreeCAD": freecad, "FreeCADGui": types.ModuleType("FreeCADGui"), "Part": part,
+                        "PySide": pyside, "PySide.QtCore": qt_core, "PySide.QtGui": qt_gui})
+    if ADDON_DIR not in sys.path:
+        sys.path.insert(0, ADDON_DIR)
+    return freecad
+
+def load(module_name):
+    """ Installs fresh stubs and imports module_name from the addon """
+    install()
+    for name in ADDON_MODULES:
+        sys.modules.pop(name, None)
+    return importlib.import_module(module_name)
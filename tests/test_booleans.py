@@ -0,0 +1,64 @@
+# tests/test_booleans.py
+
+# Retry ladder of BooleanExecutor, with execute() stubbed out (no FreeCAD needed).
+# Run with:  python -m pytest tests
+
+import types
+
+import freecad_stubs
+
+class FakeClock:
+    """ Replaces time.monotonic so timeouts need no real waiting """
+    def __init__(self): self.now = 0.0
+    def monotonic(self): return self.now
+
+class FakeResult:
+    Solids = [types.SimpleNamespace(Volume=1.0)]
+    def isNull(self): return False
+    def isValid(self): return True
+
+def make_executor(booleans, clock, timeout, outcomes):
+    """ Executor whose execute() pops an outcome per call: 'timeout' or 'ok' """
+    executor = booleans.BooleanExecutor(timeout=timeout, isolated=False)
+    executor.worker_cmd = "FreeCADCmd" # Pretend isolation is available
+    executor.calls = []
+    def execute(op, shape, tool, fuzzy, step_timeout):
+        executor.calls.append((op, fuzzy, step_timeout))
+        if outcomes.pop(0) == "timeout":
+            clock.now += step_timeout
+            raise RuntimeError(f"timed out after {step_timeout:.1f} s (worker killed)")
+        return FakeResult()
+    executor.execute = execute
+    executor.make_halfspace_tool = lambda shape, plane: "halfspace"
+    return executor
+
+def load_booleans():
+    booleans = freecad_stubs.load("PrintSplitterBooleans")
+    clock = FakeClock()
+    booleans.time = clock
+    return booleans, clock
+
+def test_timeout_moves_on_to_next_step():
+    booleans, clock = load_booleans()
+    executor = make_executor(booleans, clock, 8.0, ["timeout", "ok"])
+    result, step = executor.fuse("shape", "pin")
+    assert step == booleans.STEP_FUZZY
+    assert len(executor.calls) == 2
+    # Without a plane only plain and fuzzy apply: each gets half of the deadline
+    assert executor.calls[0][2] == 4.0
+    assert executor.calls[1][2] == 4.0
+
+def test_all_steps_share_the_deadline():
+    booleans, clock = load_booleans()
+    executor = make_executor(booleans, clock, 8.0, ["timeout"] * 4)
+    tool = types.SimpleNamespace(copy=lambda: types.SimpleNamespace(translate=lambda v: None))
+    result, step = executor.cut("shape", tool, plane=('x', 10.0))
+    assert (result, step) == (None, None)
+    assert [call[2] for call in executor.calls] == [2.0, 2.0, 2.0, 2.0]
+    assert clock.now <= 8.0 # Total time stays within the deadline
+    assert executor.failed_count == 1
+
+if __name__ == "__main__":
+    test_timeout_moves_on_to_next_step()
+    test_all_steps_share_the_deadline()
+    print("ok")
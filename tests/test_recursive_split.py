@@ -0,0 +1,117 @@
+# tests/test_recursive_split.py
+
+# Recursive (kd-tree) splitting with fake pieces made of axis-aligned boxes
+# and a fake boolean cut (no FreeCAD needed).
+# Run with:  python -m pytest tests
+
+import math
+import types
+
+import pytest
+
+import freecad_stubs
+
+class FakePiece:
+    """ A solid made of axis-aligned boxes ((xmin, ymin, zmin), (xmax, ymax, zmax)) """
+    def __init__(self, boxes):
+        self.boxes = boxes
+        self.Solids = [self]
+        self.Volume = sum(math.prod(hi[k] - lo[k] for k in range(3)) for lo, hi in boxes)
+        lows = [min(lo[k] for lo, hi in boxes) for k in range(3)]
+        highs = [max(hi[k] for lo, hi in boxes) for k in range(3)]
+        lengths = [highs[k] - lows[k] for k in range(3)]
+        self.BoundBox = types.SimpleNamespace(
+            XMin=lows[0], YMin=lows[1], ZMin=lows[2],
+            XLength=lengths[0], YLength=lengths[1], ZLength=lengths[2],
+            Center=freecad_stubs.Vector(*[(lows[k] + highs[k]) / 2 for k in range(3)]),
+            DiagonalLength=math.sqrt(sum(l * l for l in lengths)))
+    def isNull(self): return False
+
+def split_boxes(boxes, axis, position):
+    """ Clips every box against the plane; returns (below, above) box lists """
+    k = "xyz".index(axis)
+    below, above = [], []
+    for lo, hi in boxes:
+        if lo[k] < position:
+            below.append((lo, tuple(min(hi[n], position) if n == k else hi[n] for n in range(3))))
+        if hi[k] > position:
+            above.append((tuple(max(lo[n], position) if n == k else lo[n] for n in range(3)), hi))
+    return below, above
+
+class FakeBooleans:
+    """ Stands in for BooleanExecutor: a plane cut gives one fragment per side """
+    def __init__(self): self.cuts = []
+    def cut(self, piece, tool, plane=None):
+        self.cuts.append(plane)
+        fragments = [FakePiece(side) for side in split_boxes(piece.boxes, *plane) if side]
+        return types.SimpleNamespace(Solids=fragments), "plain"
+
+class NoSplitBooleans(FakeBooleans):
+    """ A cut that silently leaves the piece whole """
+    def cut(self, piece, tool, plane=None):
+        self.cuts.append(plane)
+        return types.SimpleNamespace(Solids=[piece]), "plain"
+
+def grid_piece_count(piece, printer_dims):
+    """ Non-empty cells of the global uniform grid used by grid_split() """
+    bbox = piece.BoundBox
+    cells = [piece.boxes]
+    for k, axis in enumerate("xyz"):
+        length, start = [(bbox.XLength, bbox.XMin), (bbox.YLength, bbox.YMin), (bbox.ZLength, bbox.ZMin)][k]
+        num_parts = int(math.ceil(length / printer_dims[k])) if length > printer_dims[k] else 1
+        for i in range(1, num_parts):
+            position = start + i * length / num_parts
+            cells = [side for boxes in cells for side in split_boxes(boxes, axis, position) if side]
+    return len(cells)
+
+def load_panel():
+    module = freecad_stubs.load("PrintSplitterTaskPanel")
+    panel = module.PrintSplitterTaskPanel.__new__(module.PrintSplitterTaskPanel) # No Qt UI needed
+    return module, panel
+
+def test_rotated_fit_needs_fewer_pieces_than_grid():
+    module, panel = load_panel()
+    bar = FakePiece([((0, 0, 0), (590, 100, 50))])
+    printer_dims = (200.0, 300.0, 100.0)
+    pieces = panel.recursive_split(bar, printer_dims, FakeBooleans())
+    # Halves of 295 mm fit along the 300 mm axis; the grid cuts X into 200 mm steps
+    assert len(pieces) == 2
+    assert grid_piece_count(bar, printer_dims) == 3
+    assert all(panel.check_fit(p.BoundBox, printer_dims) for p in pieces)
+
+def test_l_shape_pieces_all_fit():
+    module, panel = load_panel()
+    l_shape = FakePiece([((0, 0, 0), (590, 100, 50)), ((0, 100, 0), (100, 250, 50))])
+    printer_dims = (200.0, 200.0, 200.0)
+    pieces = panel.recursive_split(l_shape, printer_dims, FakeBooleans())
+    assert all(panel.check_fit(p.BoundBox, printer_dims) for p in pieces)
+    assert len(pieces) <= grid_piece_count(l_shape, printer_dims)
+    assert abs(sum(p.Volume for p in pieces) - l_shape.Volume) < 1e-6
+
+def test_fitting_piece_is_not_cut():
+    module, panel = load_panel()
+    booleans = FakeBooleans()
+    block = FakePiece([((0, 0, 0), (150, 150, 150))])
+    assert panel.recursive_split(block, (200.0, 200.0, 200.0), booleans) == [block]
+    assert booleans.cuts == []
+
+def test_splits_first_axis_that_exceeds_and_cuts_near_middle():
+    module, panel = load_panel()
+    booleans = FakeBooleans()
+    slab = FakePiece([((0, 0, 0), (100, 300, 50))])
+    pieces = panel.recursive_split(slab, (200.0, 200.0, 200.0), booleans)
+    assert booleans.cuts == [('y', 150.0)]
+    assert len(pieces) == 2
+
+def test_cut_that_does_not_split_raises():
+    module, panel = load_panel()
+    slab = FakePiece([((0, 0, 0), (300, 100, 50))])
+    with pytest.raises(ValueError, match="along X at 150.00 did not split"):
+        panel.recursive_split(slab, (200.0, 200.0, 200.0), NoSplitBooleans())
+
+def test_depth_limit_raises():
+    module, panel = load_panel()
+    module.MAX_RECURSION_DEPTH = 1
+    slab = FakePiece([((0, 0, 0), (900, 100, 50))]) # Needs two levels of cuts
+    with pytest.raises(ValueError, match="maximum depth"):
+        panel.recursive_split(slab, (200.0, 200.0, 200.0), FakeBooleans())
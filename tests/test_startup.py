@@ -0,0 +1,74 @@
+# tests/test_startup.py
+
+# Startup benchmark for the PrintSplitter workbench.
+# Runs without FreeCAD: FreeCAD, FreeCADGui and PySide are stubbed so the test
+# only measures what the addon itself imports when the workbench loads.
+#
+# Run with:  python -m pytest tests   or   python tests/test_startup.py
+
+import os
+import sys
+import time
+import types
+import importlib.abc
+import importlib.util
+
+ADDON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "PrintSplitterAddon")
+
+# Modules that must only be loaded when the command is activated
+LAZY_MODULES = ["Part", "Draft", "PrintSplitterTaskPanel", "PrintSplitterBooleans"]
+
+# Time budget (seconds) for importing PrintSplitter
+IMPORT_BUDGET_SECONDS = 0.05
+
+class GeometryStubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """ Serves empty Part / Draft modules so a regression shows up in sys.modules instead of as an ImportError """
+    names = ("Part", "Draft")
+    def find_spec(self, fullname, path, target=None):
+        if fullname in self.names:
+            return importlib.util.spec_from_loader(fullname, self)
+        return None
+    def create_module(self, spec): return None
+    def exec_module(self, module): pass
+
+def install_stubs():
+    """ Puts minimal FreeCAD / FreeCADGui / PySide modules in sys.modules """
+    freecad = types.ModuleType("FreeCAD")
+    freecad.Console = types.SimpleNamespace(PrintMessage=print, PrintWarning=print, PrintError=print)
+    freecad.ActiveDocument = None
+    freecad_gui = types.ModuleType("FreeCADGui")
+    pyside = types.ModuleType("PySide")
+    qt_core = types.ModuleType("PySide.QtCore")
+    qt_core.QT_TRANSLATE_NOOP = lambda context, text: text
+    qt_gui = types.ModuleType("PySide.QtGui")
+    pyside.QtCore, pyside.QtGui = qt_core, qt_gui
+    if not any(isinstance(f, GeometryStubFinder) for f in sys.meta_path):
+        sys.meta_path.append(GeometryStubFinder())
+    sys.modules.update({"FreeCAD": freecad, "FreeCADGui": freecad_gui, "PySide": pyside,
+                        "PySide.QtCore": qt_core, "PySide.QtGui": qt_gui})
+
+def import_print_splitter():
+    """ Imports PrintSplitter from a clean state and returns the elapsed time """
+    install_stubs()
+    for name in ["PrintSplitter"] + LAZY_MODULES:
+        sys.modules.pop(name, None)
+    if ADDON_DIR not in sys.path:
+        sys.path.insert(0, ADDON_DIR)
+    start_time = time.perf_counter()
+    import PrintSplitter
+    return time.perf_counter() - start_time
+
+def test_heavy_modules_are_not_imported():
+    import_print_splitter()
+    loaded = [name for name in LAZY_MODULES if name in sys.modules]
+    assert not loaded, f"Imported at workbench load time: {loaded}"
+
+def test_import_time_within_budget():
+    elapsed = import_print_splitter()
+    assert elapsed < IMPORT_BUDGET_SECONDS, f"Importing PrintSplitter took {elapsed * 1000:.1f} ms (budget {IMPORT_BUDGET_SECONDS * 1000:.0f} ms)"
+
+if __name__ == "__main__":
+    test_heavy_modules_are_not_imported()
+    elapsed = import_print_splitter()
+    print(f"PrintSplitter import time: {elapsed * 1000:.2f} ms (budget {IMPORT_BUDGET_SECONDS * 1000:.0f} ms)")
+    test_import_time_within_budget()